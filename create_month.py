@@ -15,6 +15,11 @@ import datetime
 import os
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # 日本の祝日データ（年ごとに更新してください）
 JAPAN_HOLIDAYS = {
@@ -46,39 +51,56 @@ JAPAN_HOLIDAYS = {
     }
 }
 
+# 所属判定を O(1) にするため、月ごとの祝日を frozenset に変換しておく
+JAPAN_HOLIDAYS = {
+    y: {m: frozenset(days) for m, days in months.items()}
+    for y, months in JAPAN_HOLIDAYS.items()
+}
+
 
 def get_holidays(year, month):
-    """指定月の祝日リストを取得"""
+    """指定月の祝日（日にちの frozenset）を取得"""
     if year in JAPAN_HOLIDAYS and month in JAPAN_HOLIDAYS[year]:
         return JAPAN_HOLIDAYS[year][month]
-    return []
+    return frozenset()
 
 
 def print_calendar_preview(year, month):
-    """カレンダーのプレビューを表示"""
-    print(f"\n{'='*50}")
-    print(f"  {year}年 {month}月")
-    print(f"{'='*50}")
-
+    """カレンダーのプレビューを表示（まとめて1回で出力）"""
     first_dow, num_days = calendar.monthrange(year, month)
     holidays = get_holidays(year, month)
 
-    print("  月   火   水   木   金   土   日")
-    print("  " + "     " * first_dow, end="")
+    buf = [f"\n{'='*50}\n", f"  {year}年 {month}月\n", f"{'='*50}\n"]
+    buf.append("  月   火   水   木   金   土   日\n")
+    buf.append("  " + "     " * first_dow)
+
+    # 祝日・土日は "*"、それ以外は " "（markers[d - 1] が d 日の印）
+    markers = [(" ", "*")[d in holidays or (first_dow + d - 1) % 7 >= 5]
+               for d in range(1, num_days + 1)]
 
     for d in range(1, num_days + 1):
         dow = (first_dow + d - 1) % 7
-        marker = "*" if d in holidays else " "
-        if dow >= 5:  # 土日
-            marker = "*"
-        print(f" {d:2d}{marker} ", end="")
+        buf.append(f" {d:2d}{markers[d - 1]} ")
         if dow == 6:
-            print()
+            buf.append("\n")
 
-    print()
+    buf.append("\n")
     if holidays:
-        print(f"  祝日: {', '.join(str(d) + '日' for d in holidays)}")
-    print()
+        buf.append(f"  祝日: {', '.join(str(d) + '日' for d in sorted(holidays))}\n")
+    buf.append("\n")
+    sys.stdout.write(''.join(buf))
+
+
+def write_config(config, config_path):
+    """config.json を書き出す。文字列を一度に組み立ててから1回で書き込む。"""
+    if orjson is not None:
+        payload = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(config_path, 'wb') as f:
+            f.write(payload)
+    else:
+        payload = json.dumps(config, ensure_ascii=False, indent=2)
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
 
 
 def parse_schedule_input(text):
@@ -145,8 +167,8 @@ def interactive_create():
     schedule = parse_schedule_input('\n'.join(lines))
     print(f"\n✓ {len(schedule)}日分の営業日を登録しました")
 
-    # 祝日の確認
-    holidays = get_holidays(year, month)
+    # 祝日の確認（表示と config.json 用に昇順のリストにする）
+    holidays = sorted(get_holidays(year, month))
     if holidays:
         print(f"\n祝日（自動検出）: {', '.join(str(d) + '日' for d in holidays)}")
         confirm = input("この祝日で合っていますか？ [Y/n]: ").strip().lower()
@@ -225,15 +247,15 @@ def interactive_create():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     config_path = os.path.join(script_dir, "config.json")
 
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, ensure_ascii=False, indent=2)
+    write_config(config, config_path)
 
     print(f"\n✓ config.json を更新しました")
 
     # 画像生成
     print("\nカレンダー画像を生成中...")
     import generate_calendar
-    config = generate_calendar.load_config(config_path)
+    # 書き出したばかりの config.json を読み直さず、手元の dict をそのまま使う
+    config = {**generate_calendar.DEFAULT_CONFIG, **config}
     output_path = generate_calendar.generate_calendar(config)
 
     print(f"\n{'='*50}")
@@ -249,7 +271,7 @@ def quick_create(year, month, schedule_text):
       python3 create_month.py quick 2026 4 "1 15-21, 2 17-21, ..."
     """
     schedule = parse_schedule_input(schedule_text)
-    holidays = get_holidays(year, month)
+    holidays = sorted(get_holidays(year, month))  # config.json 用にリスト化
 
     config = {
         "year": year,
@@ -267,11 +289,11 @@ def quick_create(year, month, schedule_text):
     script_dir = os.path.dirname(os.path.abspath(__file__))
     config_path = os.path.join(script_dir, "config.json")
 
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, ensure_ascii=False, indent=2)
+    write_config(config, config_path)
 
     import generate_calendar
-    config = generate_calendar.load_config(config_path)
+    # 書き出したばかりの config.json を読み直さず、手元の dict をそのまま使う
+    config = {**generate_calendar.DEFAULT_CONFIG, **config}
     generate_calendar.generate_calendar(config)
 
 
@@ -8,13 +8,26 @@ Instagram カレンダー画像ジェネレーター
   python3 generate_calendar.py config.json  → 指定ファイルから生成
 """
 
-import calendar
 import datetime
+import functools
 import json
 import sys
 import os
+import re
+from array import array
 from PIL import Image, ImageDraw, ImageFont
 
+# JSON パーサー（orjson → ujson → 標準 json の順に使えるものを使う）
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        _loads = json.loads
+
 # ============================================================
 # デフォルト設定（config.json で上書き可能）
 # ============================================================
@@ -62,7 +75,10 @@ DEFAULT_CONFIG = {
     "bottom_text": "ご予約は 055-957-4500 / 070-8419-5489 にて承ります",
 
     # 出力ファイル名（空欄だと自動命名）
-    "output_filename": ""
+    "output_filename": "",
+
+    # PNG の圧縮レベル（0-9）。1 は高速、公開用にサイズを抑えたい場合は 6 など
+    "png_compress_level": 1
 }
 
 
@@ -111,25 +127,32 @@ DATE_TRACKING     = -3   # 2桁日付の文字間調整（負で詰め）
 
 DAY_NAMES = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
 
+# 連続生成時に使い回すキャンバス（generate_calendar はシングルスレッドで呼ぶ前提）
+_CANVAS = None
+
 
 def load_config(config_path=None):
     """設定を読み込む"""
     config = DEFAULT_CONFIG.copy()
 
     if config_path and os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            user_config = json.load(f)
+        with open(config_path, 'rb') as f:
+            user_config = _loads(f.read())
         config.update(user_config)
     elif os.path.exists("config.json"):
-        with open("config.json", 'r', encoding='utf-8') as f:
-            user_config = json.load(f)
+        with open("config.json", 'rb') as f:
+            user_config = _loads(f.read())
         config.update(user_config)
 
     return config
 
 
+@functools.lru_cache(maxsize=64)
 def _load_font(path, size, index=0):
-    """フォントを読み込む。TTC の場合は index でウェイトを指定。"""
+    """
+    フォントを読み込む。TTC の場合は index でウェイトを指定。
+    連続生成時に同じファイルを何度も解析しないよう、読み込んだフォントは使い回す。
+    """
     return ImageFont.truetype(path, size, index=index)
 
 
@@ -157,7 +180,7 @@ def load_fonts(config):
     # 日付フォント（date_font が指定されていればそちらを優先）
     date_font_path = config.get('date_font', config['latin_font_bold'])
     try:
-        fonts['date'] = ImageFont.truetype(date_font_path, SIZE_DATE)
+        fonts['date'] = _load_font(date_font_path, SIZE_DATE)
     except:
         try:
             fonts['date'] = _load_font(config['latin_font_bold'], SIZE_DATE, latin_bold_idx)
@@ -168,53 +191,72 @@ def load_fonts(config):
     fonts['month_prefix'] = _load_font(config['latin_font'], SIZE_MONTH_PREFIX, latin_idx)
     fonts['hours'] = _load_font(config['latin_font'], SIZE_HOURS, latin_idx)
     fonts['closed'] = _load_font(config['latin_font'], SIZE_CLOSED, latin_idx)
-    fonts['bottom_jp'] = ImageFont.truetype(config['japanese_font'], SIZE_BOTTOM)
+    fonts['bottom_jp'] = _load_font(config['japanese_font'], SIZE_BOTTOM)
     fonts['bottom_latin'] = _load_font(config['latin_font'], SIZE_BOTTOM, latin_idx)
-    fonts['event_jp'] = ImageFont.truetype(config['japanese_font'], SIZE_EVENT)
+    fonts['event_jp'] = _load_font(config['japanese_font'], SIZE_EVENT)
     fonts['event_latin'] = _load_font(config['latin_font'], SIZE_EVENT, latin_idx)
 
     return fonts
 
 
+_MONTH_LEN = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_SAKAMOTO_T = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+
+def _is_leap(y):
+    """うるう年かどうか"""
+    return (y % 4 == 0 and y % 100 != 0) or y % 400 == 0
+
+
+def _month_first_dow(y, m):
+    """月の初日の曜日（0=月, 6=日）。Sakamoto の公式で定数時間に求める。"""
+    if m < 3:
+        y -= 1
+    dow = (y + y // 4 - y // 100 + y // 400 + _SAKAMOTO_T[m - 1] + 1) % 7  # 0=日
+    return (dow + 6) % 7
+
+
+@functools.lru_cache(maxsize=64)
+def _month_info(y, m):
+    """(初日の曜日, 日数) を返す。calendar.monthrange と同じ値。"""
+    num_days = 29 if m == 2 and _is_leap(y) else _MONTH_LEN[m - 1]
+    return _month_first_dow(y, m), num_days
+
+
 def build_simple_calendar(year, month):
     """
     シンプルなカレンダーグリッド構築。
-    返り値: weeks (各週は7要素のリスト、各要素は (day, month_offset))
-    month_offset: -1=前月, 0=当月, 1=翌月
+    返り値: (days, offsets, num_weeks)
+      days/offsets は週ごとに7セルずつ並べた平らな配列で、セル (row, col) は
+      インデックス row * 7 + col。offsets の値は -1=前月, 0=当月, 1=翌月
     """
     # 月の初日の曜日（0=月, 6=日）と日数
-    first_dow, num_days = calendar.monthrange(year, month)
+    first_dow, num_days = _month_info(year, month)
 
     # 前月の日数
     if month == 1:
-        prev_days = calendar.monthrange(year - 1, 12)[1]
+        prev_days = _month_info(year - 1, 12)[1]
     else:
-        prev_days = calendar.monthrange(year, month - 1)[1]
+        prev_days = _month_info(year, month - 1)[1]
 
     # 全セルを生成（前月の端数 + 当月 + 翌月の端数）
-    cells = []
+    days = array('b')
+    offsets = array('b')
 
     # 前月の端数
-    for i in range(first_dow):
-        d = prev_days - first_dow + 1 + i
-        cells.append((d, -1))
+    days.extend(range(prev_days - first_dow + 1, prev_days + 1))
+    offsets.extend([-1] * first_dow)
 
     # 当月
-    for d in range(1, num_days + 1):
-        cells.append((d, 0))
+    days.extend(range(1, num_days + 1))
+    offsets.extend([0] * num_days)
 
     # 翌月の端数（7の倍数になるまで）
-    next_d = 1
-    while len(cells) % 7 != 0:
-        cells.append((next_d, 1))
-        next_d += 1
+    pad = -(first_dow + num_days) % 7
+    days.extend(range(1, pad + 1))
+    offsets.extend([1] * pad)
 
-    # 週に分割
-    weeks = []
-    for i in range(0, len(cells), 7):
-        weeks.append(cells[i:i+7])
-
-    return weeks
+    return days, offsets, len(days) // 7
 
 
 def is_weekend(dow):
@@ -222,26 +264,13 @@ def is_weekend(dow):
     return dow >= 5
 
 
-def is_holiday(day, month_offset, config):
-    """祝日かどうか"""
-    if month_offset == 0:
-        return day in config.get('holidays', [])
-    elif month_offset == -1:
-        return day in config.get('prev_month_holidays', [])
-    elif month_offset == 1:
-        return day in config.get('next_month_holidays', [])
-    return False
-
-
-def get_hours(day, month_offset, config):
-    """営業時間を取得"""
-    if month_offset == 0:
-        return config['schedule'].get(str(day), None)
-    elif month_offset == -1:
-        return config.get('prev_month_schedule', {}).get(str(day), None)
-    elif month_offset == 1:
-        return config.get('next_month_schedule', {}).get(str(day), None)
-    return None
+def _int_keyed_schedule(schedule):
+    """
+    {"日": "時間"} を {日(int): "時間"} に変換。
+    str(day) と一致するキーだけを残す。"1日" や "01" などはどの日にも該当しないので
+    定休日扱いとして読み飛ばす。
+    """
+    return {int(k): v for k, v in schedule.items() if k.isdecimal() and str(int(k)) == k}
 
 
 def get_month_prefix(month_offset, year, month):
@@ -255,12 +284,26 @@ def get_month_prefix(month_offset, year, month):
     return ""
 
 
+@functools.lru_cache(maxsize=512)
+def _measure(text, font):
+    """
+    テキストの (幅, 高さ, 上端オフセット) を返す。
+    同じ文字列（日付・曜日・営業時間など）は何度も計測されるためキャッシュする。
+    """
+    bbox = font.getbbox(text, "L")
+    return bbox[2] - bbox[0], bbox[3] - bbox[1], bbox[1]
+
+
+@functools.lru_cache(maxsize=64)
+def _metrics(font):
+    """フォントの (ascent, descent)。フォントごとに一定なのでキャッシュする。"""
+    return font.getmetrics()
+
+
 def draw_centered_text(draw, x, y, text, font, color, tracking=0):
     """中央揃えでテキストを描画。tracking で文字間を調整（負で詰め）。"""
     if tracking == 0 or len(text) <= 1:
-        bbox = draw.textbbox((0, 0), text, font=font)
-        tw = bbox[2] - bbox[0]
-        th = bbox[3] - bbox[1]
+        tw, th, _ = _measure(text, font)
         draw.text((x - tw / 2, y - th / 2), text, fill=color, font=font)
         return
 
@@ -268,9 +311,9 @@ def draw_centered_text(draw, x, y, text, font, color, tracking=0):
     char_widths = []
     max_h = 0
     for ch in text:
-        bbox = draw.textbbox((0, 0), ch, font=font)
-        char_widths.append(bbox[2] - bbox[0])
-        max_h = max(max_h, bbox[3] - bbox[1])
+        w, h, _ = _measure(ch, font)
+        char_widths.append(w)
+        max_h = max(max_h, h)
 
     total_w = sum(char_widths) + tracking * (len(text) - 1)
     cx = x - total_w / 2
@@ -280,34 +323,25 @@ def draw_centered_text(draw, x, y, text, font, color, tracking=0):
         cx += char_widths[i] + tracking
 
 
+# is_latin_char と同じ範囲の文字の連続にマッチ
+_LATIN_RUN_RE = re.compile(r'([\u0000-\u2FFF\uFF00-\uFFEF]+)')
+
+
 def is_latin_char(ch):
     """ラテン文字・数字・記号かどうか"""
     cp = ord(ch)
     return cp < 0x3000 or (0xFF00 <= cp <= 0xFFEF)
 
 
+@functools.lru_cache(maxsize=64)
 def split_text_segments(text):
-    """テキストを日本語/ラテンのセグメントに分割"""
-    segments = []
-    current = ""
-    current_is_latin = None
-
-    for ch in text:
-        ch_latin = is_latin_char(ch)
-        if current_is_latin is None:
-            current_is_latin = ch_latin
-        if ch_latin != current_is_latin:
-            if current:
-                segments.append((current, current_is_latin))
-            current = ch
-            current_is_latin = ch_latin
-        else:
-            current += ch
-
-    if current:
-        segments.append((current, current_is_latin))
-
-    return segments
+    """
+    テキストを日本語/ラテンのセグメントに分割。
+    返り値: (セグメント文字列, ラテンかどうか) のタプル
+    """
+    # キャプチャ付き split なので奇数番目がラテン文字の連続部分になる
+    parts = _LATIN_RUN_RE.split(text)
+    return tuple((part, i % 2 == 1) for i, part in enumerate(parts) if part)
 
 
 def draw_bottom_text(draw, y, text, fonts, color):
@@ -322,10 +356,9 @@ def draw_bottom_text(draw, y, text, fonts, color):
     seg_info = []
     for seg_text, is_latin in segments:
         font = fonts['bottom_latin'] if is_latin else fonts['bottom_jp']
-        bbox = draw.textbbox((0, 0), seg_text, font=font)
-        w = bbox[2] - bbox[0]
-        ascent, descent = font.getmetrics()
-        seg_info.append((seg_text, font, w, ascent, descent, bbox[1]))
+        w, _, top = _measure(seg_text, font)
+        ascent, descent = _metrics(font)
+        seg_info.append((seg_text, font, w, ascent, descent, top))
         total_w += w
 
     # 最大のascentを基準にベースラインを揃える
@@ -352,7 +385,7 @@ def should_show_adjacent_weekends(year, month):
     - 翌月の週末: 当月の末日が金曜 or 土曜の場合のみ（翌週末を表示して完成）
       月末が日〜木の場合、翌月の週末は離れているため表示しない
     """
-    first_dow, num_days = calendar.monthrange(year, month)
+    first_dow, num_days = _month_info(year, month)
     last_dow = (first_dow + num_days - 1) % 7  # 末日の曜日 (0=月...6=日)
 
     show_prev = (first_dow == 6)       # 月初が日曜 → 前月土曜を表示
@@ -378,46 +411,50 @@ def should_show_cell(dow, month_offset, show_prev_weekends, show_next_weekends):
     return False
 
 
-def find_event_position(event, weeks, year, month):
+def find_event_position(event, cur_month_cells):
     """
     イベントがカレンダー上のどの行・列に位置するかを計算。
+    cur_month_cells: 当月の {日: (row_idx, col)}
     返り値: (row_idx, start_col, end_col) のリスト（複数行にまたがる場合）
     """
-    first_dow = calendar.monthrange(year, month)[0]
     start_day = event['start']
     end_day = event.get('end', start_day)
 
-    positions = []
-    for row_idx, week in enumerate(weeks):
-        row_start_col = None
-        row_end_col = None
-        for col, (day, month_offset) in enumerate(week):
-            if month_offset == 0 and start_day <= day <= end_day:
-                if row_start_col is None:
-                    row_start_col = col
-                row_end_col = col
-        if row_start_col is not None:
-            positions.append((row_idx, row_start_col, row_end_col))
+    # 範囲外の日付（end の入力ミスなど）で無駄に回らないよう当月の日付に収める
+    rows = {}
+    for d in range(max(start_day, 1), min(end_day, max(cur_month_cells)) + 1):
+        if d not in cur_month_cells:
+            continue
+        row_idx, col = cur_month_cells[d]
+        if row_idx in rows:
+            lo, hi = rows[row_idx]
+            rows[row_idx] = (min(lo, col), max(hi, col))
+        else:
+            rows[row_idx] = (col, col)
 
-    return positions
+    return [(row_idx, lo, hi) for row_idx, (lo, hi) in rows.items()]
 
 
-def wrap_event_text(text, font, max_width, draw):
+def wrap_event_text(text, font, max_width):
     """
     テキストをボックス幅に収まるよう折り返す。
+    各行は幅に収まる最長の先頭部分（最低1文字）で、区切り位置は二分探索で求める。
     """
     lines = []
-    current = ""
-    for ch in text:
-        test = current + ch
-        bbox = draw.textbbox((0, 0), test, font=font)
-        if bbox[2] - bbox[0] > max_width and current:
-            lines.append(current)
-            current = ch
-        else:
-            current = test
-    if current:
-        lines.append(current)
+    rest = text
+    while rest:
+        if _measure(rest, font)[0] <= max_width:
+            lines.append(rest)
+            break
+        lo, hi = 1, len(rest) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if _measure(rest[:mid], font)[0] <= max_width:
+                lo = mid
+            else:
+                hi = mid - 1
+        lines.append(rest[:lo])
+        rest = rest[lo:]
     return lines
 
 
@@ -436,8 +473,7 @@ def draw_event_box(draw, row_idx, start_col, end_col, text, fonts, y_first_row,
 
     # テキストが1行に収まるようボックス幅を自動拡張
     font = fonts['event_jp']
-    text_bbox = draw.textbbox((0, 0), text, font=font)
-    text_w = text_bbox[2] - text_bbox[0]
+    text_w = _measure(text, font)[0]
     needed_w = text_w + EVENT_BOX_PAD_H * 2
     box_w = x_right - x_left
     if needed_w > box_w:
@@ -446,13 +482,10 @@ def draw_event_box(draw, row_idx, start_col, end_col, text, fonts, y_first_row,
         x_right = center_x + needed_w / 2
 
     max_text_w = (x_right - x_left) - EVENT_BOX_PAD_H * 2
-    lines = wrap_event_text(text, font, max_text_w, draw)
+    lines = wrap_event_text(text, font, max_text_w)
 
     # ボックスの高さを計算
-    line_heights = []
-    for line in lines:
-        bbox = draw.textbbox((0, 0), line, font=font)
-        line_heights.append(bbox[3] - bbox[1])
+    line_heights = [_measure(line, font)[1] for line in lines]
 
     total_text_h = sum(line_heights) + EVENT_LINE_GAP * (len(lines) - 1) if lines else 0
     box_h = total_text_h + EVENT_BOX_PAD_V * 2
@@ -468,26 +501,61 @@ def draw_event_box(draw, row_idx, start_col, end_col, text, fonts, y_first_row,
     # テキストを描画（中央揃え）
     y_text = y_box_top + EVENT_BOX_PAD_V
     for i, line in enumerate(lines):
-        bbox = draw.textbbox((0, 0), line, font=font)
-        tw = bbox[2] - bbox[0]
-        th = bbox[3] - bbox[1]
+        tw, th, _ = _measure(line, font)
         x_text = (x_left + x_right) / 2 - tw / 2
         draw.text((x_text, y_text), line, fill=COLOR_DARK, font=font)
         y_text += th + EVENT_LINE_GAP
 
 
+@functools.lru_cache(maxsize=8)
+def _chrome_template(header_font, year_font, year):
+    """
+    月によらない部分（年・曜日ヘッダー）だけを描画した背景画像。
+    同じ年を続けて生成するときはキャッシュから貼り付けるだけで済む。
+    """
+    img = Image.new('RGB', (IMG_W, IMG_H), BG_COLOR)
+    draw = ImageDraw.Draw(img)
+
+    # --- 年 ---
+    year_str = str(year)
+    year_h = _measure(year_str, year_font)[1]
+    year_x = 830
+    draw.text((year_x, Y_YEAR - year_h / 2),
+              year_str, fill=COLOR_DARK, font=year_font)
+
+    # --- 曜日ヘッダー ---
+    for dow, name in enumerate(DAY_NAMES):
+        color = COLOR_ORANGE if dow >= 5 else COLOR_HEADER
+        draw_centered_text(draw, COL_X[dow], Y_HEADERS, name,
+                          header_font, color)
+
+    return img
+
+
 def generate_calendar(config):
     """カレンダー画像を生成"""
+    global _CANVAS
     year = config['year']
     month = config['month']
 
+    # 営業時間・祝日を月オフセットごとに引けるよう整形（-1=前月, 0=当月, 1=翌月）
+    sched = {
+        0: _int_keyed_schedule(config['schedule']),
+        -1: _int_keyed_schedule(config.get('prev_month_schedule', {})),
+        1: _int_keyed_schedule(config.get('next_month_schedule', {})),
+    }
+    hols = {
+        0: frozenset(config.get('holidays', [])),
+        -1: frozenset(config.get('prev_month_holidays', [])),
+        1: frozenset(config.get('next_month_holidays', [])),
+    }
+
     # フォント読み込み
     fonts = load_fonts(config)
 
     # カレンダーグリッド構築
-    weeks = build_simple_calendar(year, month)
+    days, offsets, num_weeks = build_simple_calendar(year, month)
     show_prev_weekends, show_next_weekends = should_show_adjacent_weekends(year, month)
-    num_weeks = len(weeks)
 
     # 行間を動的に計算（5行 or 6行に対応）
     available_height = Y_BOTTOM_TEXT - Y_FIRST_ROW - 100
@@ -495,7 +563,13 @@ def generate_calendar(config):
     row_height = min(row_height, 155)  # 最大155px
 
     # 画像作成
-    img = Image.new('RGB', (IMG_W, IMG_H), BG_COLOR)
+    # 年・曜日ヘッダーは描画済みのテンプレートを貼り付け、前回のキャンバスを再利用する
+    template = _chrome_template(fonts['header'], fonts['year'], year)
+    if _CANVAS is None:
+        _CANVAS = template.copy()
+    else:
+        _CANVAS.paste(template)
+    img = _CANVAS
     draw = ImageDraw.Draw(img)
 
     # --- 月の数字 ---
@@ -503,34 +577,32 @@ def generate_calendar(config):
     draw_centered_text(draw, IMG_W // 2, Y_MONTH_NUM, month_str,
                        fonts['month_num'], COLOR_DARK)
 
-    # --- 年 ---
-    year_str = str(year)
-    year_bbox = draw.textbbox((0, 0), year_str, font=fonts['year'])
-    year_x = 830
-    draw.text((year_x, Y_YEAR - (year_bbox[3] - year_bbox[1]) / 2),
-              year_str, fill=COLOR_DARK, font=fonts['year'])
-
-    # --- 曜日ヘッダー ---
-    for dow, name in enumerate(DAY_NAMES):
-        color = COLOR_ORANGE if dow >= 5 else COLOR_HEADER
-        draw_centered_text(draw, COL_X[dow], Y_HEADERS, name,
-                          fonts['header'], color)
-
     # --- カレンダーグリッド ---
-    for row_idx, week in enumerate(weeks):
+    # ループ内で毎回引かないよう、フォント・列座標・曜日ごとの色をローカルに束ねる
+    f_date = fonts['date']
+    f_prefix = fonts['month_prefix']
+    f_hours = fonts['hours']
+    f_closed = fonts['closed']
+    col_x = COL_X
+    date_colors = (COLOR_DARK,) * 5 + (COLOR_ORANGE,) * 2
+
+    for row_idx in range(num_weeks):
         y_date = Y_FIRST_ROW + int(row_idx * row_height)
         y_hours = y_date + Y_HOURS_OFFSET
 
-        for dow, (day, month_offset) in enumerate(week):
+        for dow in range(7):
+            idx = row_idx * 7 + dow
+            day = days[idx]
+            month_offset = offsets[idx]
+
             # 前月/翌月の非表示セルはスキップ
             if not should_show_cell(dow, month_offset, show_prev_weekends, show_next_weekends):
                 continue
 
-            x = COL_X[dow]
+            x = col_x[dow]
 
-            # 色を決定
-            colored = is_weekend(dow) or is_holiday(day, month_offset, config)
-            date_color = COLOR_ORANGE if colored else COLOR_DARK
+            # 色を決定（土日は date_colors 側で橙、祝日は曜日に関係なく橙）
+            date_color = COLOR_ORANGE if day in hols[month_offset] else date_colors[dow]
 
             # 月プレフィックスを付けるかどうか判定
             # 前月/翌月の日付は常にプレフィックス付き
@@ -550,53 +622,52 @@ def generate_calendar(config):
             trk = DATE_TRACKING if 10 <= day <= 19 else 0
             if needs_prefix:
                 prefix_text = prefix + "/"
-                prefix_bbox = draw.textbbox((0, 0), prefix_text, font=fonts['month_prefix'])
+                prefix_w = _measure(prefix_text, f_prefix)[0]
 
                 # 日付部分の幅をトラッキング込みで計算
-                char_widths = []
-                for ch in day_str:
-                    cb = draw.textbbox((0, 0), ch, font=fonts['date'])
-                    char_widths.append(cb[2] - cb[0])
+                char_widths = [_measure(ch, f_date)[0] for ch in day_str]
                 day_w = sum(char_widths) + trk * (len(day_str) - 1)
-                day_bbox = draw.textbbox((0, 0), day_str, font=fonts['date'])
+                day_h = _measure(day_str, f_date)[1]
 
-                prefix_w = prefix_bbox[2] - prefix_bbox[0]
                 total_w = prefix_w + day_w
 
                 start_x = x - total_w / 2
 
                 # プレフィックス（小さく、上寄り）
-                day_h = day_bbox[3] - day_bbox[1]
                 prefix_y = y_date - day_h / 2 - 4
                 draw.text((start_x, prefix_y), prefix_text,
-                         fill=date_color, font=fonts['month_prefix'])
+                         fill=date_color, font=f_prefix)
 
                 # 日付（1文字ずつトラッキング付きで描画）
                 day_x = start_x + prefix_w
                 day_y = y_date - day_h / 2
                 for i, ch in enumerate(day_str):
                     draw.text((day_x, day_y), ch,
-                             fill=date_color, font=fonts['date'])
+                             fill=date_color, font=f_date)
                     day_x += char_widths[i] + trk
             else:
                 # プレフィックスなし
                 draw_centered_text(draw, x, y_date, day_str,
-                                  fonts['date'], date_color, tracking=trk)
+                                  f_date, date_color, tracking=trk)
 
             # 営業時間描画
-            hours = get_hours(day, month_offset, config)
+            hours = sched[month_offset].get(day)
             if hours is not None:
                 draw_centered_text(draw, x, y_hours, hours,
-                                  fonts['hours'], COLOR_DARK)
+                                  f_hours, COLOR_DARK)
             elif month_offset == 0:
                 # 当月で営業時間がない = 定休日
                 draw_centered_text(draw, x, y_hours, "-",
-                                  fonts['closed'], COLOR_GRAY)
+                                  f_closed, COLOR_GRAY)
 
     # --- イベントボックス ---
     events = config.get('events', [])
+    cur_month_cells = {
+        days[idx]: divmod(idx, 7)
+        for idx in range(num_weeks * 7) if offsets[idx] == 0
+    }
     for event in events:
-        positions = find_event_position(event, weeks, year, month)
+        positions = find_event_position(event, cur_month_cells)
         for row_idx, start_col, end_col in positions:
             draw_event_box(draw, row_idx, start_col, end_col,
                           event['name'], fonts, Y_FIRST_ROW, row_height)
@@ -617,7 +688,8 @@ def generate_calendar(config):
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output_path = os.path.join(script_dir, output)
 
-    img.save(output_path, 'PNG', quality=95)
+    compress_level = config.get('png_compress_level', 1)
+    img.save(output_path, 'PNG', optimize=False, compress_level=compress_level)
     print(f"✓ カレンダー画像を生成しました: {output_path}")
     print(f"  {year}年{month}月 / {IMG_W}x{IMG_H}px / {num_weeks}週")
 